@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Any
 
 import aiohttp
+import orjson
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -13,11 +15,22 @@ from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN, DEFAULT_PORT, DEFAULT_SCAN_INTERVAL
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    BREAKER_COOLDOWN,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_BACKOFF,
+    REQUEST_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maps (host, port) to the loop time until which connection attempts are skipped
+_BREAKER: dict[tuple[str, int], float] = {}
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -33,51 +46,62 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     port = data[CONF_PORT]
     
     url = f"http://{host}:{port}/status"
+    session = async_get_clientsession(hass)
     
-    # Retry up to 10 times with exponential backoff
-    last_error = None
-    for attempt in range(10):
-        try:
-            _LOGGER.info(f"Attempting to connect to BBS Status endpoint (attempt {attempt + 1}/10): {url}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+    # Skip hosts that recently failed every attempt instead of retrying again
+    key = (host, port)
+    if _BREAKER.get(key, 0) > hass.loop.time():
+        raise CannotConnect(f"Circuit open for {url} after repeated failures")
+    
+    try:
+        # Retry up to 10 times with exponential backoff
+        last_error = None
+        for attempt in range(10):
+            try:
+                _LOGGER.info("Attempting to connect to BBS Status endpoint (attempt %d/10): %s", attempt + 1, url)
+                async with session.get(url, timeout=REQUEST_TIMEOUT) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        result = orjson.loads(await response.read())
                         if "status" in result:
-                            _LOGGER.info(f"Successfully connected to BBS Status endpoint: {url}")
+                            _LOGGER.info("Successfully connected to BBS Status endpoint: %s", url)
+                            _BREAKER.pop(key, None)
                             return {"title": f"BBS Status - {host}:{port}"}
                         else:
                             last_error = f"Invalid response format: missing 'status' key in response from {url}"
-                            _LOGGER.warning(f"Invalid response format on attempt {attempt + 1} for {url}: {last_error}")
+                            _LOGGER.warning("Invalid response format on attempt %d for %s: %s", attempt + 1, url, last_error)
                             if attempt == 9:  # Last attempt
                                 raise CannotConnect(last_error)
-                            continue  # Retry on invalid format
                     else:
                         last_error = f"HTTP {response.status}: {response.reason} from {url}"
-                        _LOGGER.warning(f"HTTP error on attempt {attempt + 1} for {url}: {last_error}")
+                        _LOGGER.warning("HTTP error on attempt %d for %s: %s", attempt + 1, url, last_error)
                         if attempt == 9:  # Last attempt
                             raise CannotConnect(last_error)
-                        continue  # Retry on HTTP error
-        except aiohttp.ClientError as err:
-            last_error = f"Connection error to {url}: {err}"
-            _LOGGER.warning(f"Connection error on attempt {attempt + 1} for {url}: {last_error}")
-            if attempt == 9:  # Last attempt
-                raise CannotConnect(f"Connection failed after 10 attempts to {url}. Last error: {last_error}")
-            continue  # Retry on connection error
-        except Exception as err:
-            last_error = f"Unexpected error accessing {url}: {err}"
-            _LOGGER.warning(f"Unexpected error on attempt {attempt + 1} for {url}: {last_error}")
-            if attempt == 9:  # Last attempt
-                raise CannotConnect(f"Unexpected error after 10 attempts accessing {url}. Last error: {last_error}")
-            continue  # Retry on other errors
+            except aiohttp.ClientError as err:
+                last_error = f"Connection error to {url}: {err}"
+                _LOGGER.warning("Connection error on attempt %d for %s: %s", attempt + 1, url, last_error)
+                if attempt == 9:  # Last attempt
+                    raise CannotConnect(f"Connection failed after 10 attempts to {url}. Last error: {last_error}")
+            except asyncio.TimeoutError:
+                last_error = f"Timeout connecting to {url}"
+                _LOGGER.warning("Timeout on attempt %d for %s", attempt + 1, url)
+                if attempt == 9:  # Last attempt
+                    raise CannotConnect(f"Connection timed out after 10 attempts to {url}")
+            except ValueError as err:
+                last_error = f"Invalid JSON in response from {url}: {err}"
+                _LOGGER.warning("Invalid JSON on attempt %d for %s: %s", attempt + 1, url, last_error)
+                if attempt == 9:  # Last attempt
+                    raise CannotConnect(last_error)
         
-        # Wait before retry (exponential backoff)
-        if attempt < 9:
-            wait_time = 2 ** attempt
-            _LOGGER.info(f"Waiting {wait_time} seconds before retry...")
-            await asyncio.sleep(wait_time)
+            # Wait before retry (exponential backoff with full jitter)
+            if attempt < 9:
+                wait_time = random.uniform(0, min(2 ** attempt, MAX_BACKOFF))
+                _LOGGER.info("Waiting %.1f seconds before retry...", wait_time)
+                await asyncio.sleep(wait_time)
     
-    raise CannotConnect(f"Failed to connect after 10 attempts. Last error: {last_error}")
+        raise CannotConnect(f"Failed to connect after 10 attempts. Last error: {last_error}")
+    except CannotConnect:
+        _BREAKER[key] = hass.loop.time() + BREAKER_COOLDOWN
+        raise
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
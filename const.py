@@ -1,5 +1,11 @@
 """Constants for the BBS Status integration."""
 
+import aiohttp
+
 DOMAIN = "bbs_status"
 DEFAULT_PORT = 8080
 DEFAULT_SCAN_INTERVAL = 60
+
+MAX_BACKOFF = 60
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+BREAKER_COOLDOWN = 30
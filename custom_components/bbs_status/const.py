@@ -1,5 +0,0 @@
-"""Constants for the BBS Status integration."""
-
-DOMAIN = "bbs_status"
-DEFAULT_PORT = 8080
-DEFAULT_SCAN_INTERVAL = 60
@@ -7,16 +7,21 @@ from datetime import timedelta
 from typing import Any
 
 import aiohttp
-import async_timeout
+import orjson
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
-from .const import DOMAIN
+from .const import DOMAIN, REQUEST_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +48,9 @@ class BBSStatusDataUpdateCoordinator(DataUpdateCoordinator):
         self.host = config_entry.data[CONF_HOST]
         self.port = config_entry.data[CONF_PORT]
         self.scan_interval = config_entry.data[CONF_SCAN_INTERVAL]
+        self._session = async_get_clientsession(hass)
+        self._url = f"http://{self.host}:{self.port}/status"
+        self._inflight: asyncio.Task[dict[str, Any]] | None = None
         
         super().__init__(
             hass,
@@ -53,122 +61,76 @@ class BBSStatusDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
-        url = f"http://{self.host}:{self.port}/status"
-        
-        # Retry up to 10 times with exponential backoff
-        last_error = None
-        for attempt in range(10):
-            try:
-                _LOGGER.debug(f"Fetching BBS Status data (attempt {attempt + 1}/10): {url}")
-                async with async_timeout.timeout(10):
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                if "status" in data:
-                                    _LOGGER.debug(f"Successfully fetched BBS Status data from: {url}")
-                                    return data["status"]
-                                else:
-                                    last_error = f"Invalid response format: missing 'status' key in response from {url}"
-                                    _LOGGER.warning(f"Invalid response format on attempt {attempt + 1} for {url}: {last_error}")
-                                    if attempt == 9:  # Last attempt
-                                        raise UpdateFailed(last_error)
-                                    continue  # Retry on invalid format
-                            else:
-                                last_error = f"HTTP {response.status}: {response.reason} from {url}"
-                                _LOGGER.warning(f"HTTP error on attempt {attempt + 1} for {url}: {last_error}")
-                                if attempt == 9:  # Last attempt
-                                    raise UpdateFailed(last_error)
-                                continue  # Retry on HTTP error
-            except aiohttp.ClientError as err:
-                last_error = f"Connection error to {url}: {err}"
-                _LOGGER.warning(f"Connection error on attempt {attempt + 1} for {url}: {last_error}")
-                if attempt == 9:  # Last attempt
-                    raise UpdateFailed(f"Connection failed after 10 attempts to {url}. Last error: {last_error}")
-                continue  # Retry on connection error
-            except Exception as err:
-                last_error = f"Unexpected error accessing {url}: {err}"
-                _LOGGER.warning(f"Unexpected error on attempt {attempt + 1} for {url}: {last_error}")
-                if attempt == 9:  # Last attempt
-                    raise UpdateFailed(f"Unexpected error after 10 attempts accessing {url}. Last error: {last_error}")
-                continue  # Retry on other errors
-            
-            # Wait before retry (exponential backoff)
-            if attempt < 9:
-                wait_time = 2 ** attempt
-                _LOGGER.debug(f"Waiting {wait_time} seconds before retry...")
-                await asyncio.sleep(wait_time)
-        
-        raise UpdateFailed(f"Failed to fetch data after 10 attempts. Last error: {last_error}")
-
-
-class BBSStatusSensor(SensorEntity):
+        # Overlapping refreshes share the request that is already in flight
+        if self._inflight is None or self._inflight.done():
+            self._inflight = self.hass.async_create_task(self._async_fetch_status())
+        return await asyncio.shield(self._inflight)
+
+    async def _async_fetch_status(self) -> dict[str, Any]:
+        """Fetch the status from the BBS."""
+        # Failed refreshes are retried by DataUpdateCoordinator on the next
+        # update interval, so only a single request is made here
+        try:
+            _LOGGER.debug("Fetching BBS Status data: %s", self._url)
+            async with self._session.get(self._url, timeout=REQUEST_TIMEOUT) as response:
+                if response.status != 200:
+                    raise UpdateFailed(f"HTTP {response.status}: {response.reason} from {self._url}")
+                data = orjson.loads(await response.read())
+        except aiohttp.ClientError as err:
+            raise UpdateFailed(f"Connection error to {self._url}: {err}") from err
+        except asyncio.TimeoutError as err:
+            raise UpdateFailed(f"Timeout connecting to {self._url}") from err
+        except ValueError as err:
+            raise UpdateFailed(f"Invalid JSON in response from {self._url}: {err}") from err
+
+        if "status" not in data:
+            raise UpdateFailed(f"Invalid response format: missing 'status' key in response from {self._url}")
+
+        _LOGGER.debug("Successfully fetched BBS Status data from: %s", self._url)
+        return data["status"]
+
+
+class BBSStatusSensor(CoordinatorEntity[BBSStatusDataUpdateCoordinator], SensorEntity):
     """Representation of a BBS Status sensor."""
 
     def __init__(self, coordinator: BBSStatusDataUpdateCoordinator) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"BBS Status - {self.coordinator.host}:{self.coordinator.port}"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"bbs_status_{self.coordinator.host}_{self.coordinator.port}"
-
-    @property
-    def state(self) -> str:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return "Unknown"
+        super().__init__(coordinator)
+        self._attr_name = f"BBS Status - {coordinator.host}:{coordinator.port}"
+        self._attr_unique_id = f"bbs_status_{coordinator.host}_{coordinator.port}"
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        self.async_write_ha_state()
+
+    def _update_from_data(self) -> None:
+        """Compute the state, icon and attributes from the coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            self._attr_native_value = "Unknown"
+            self._attr_icon = "mdi:help-circle"
+            self._attr_extra_state_attributes = {}
+            return
         
-        used_instances = self.coordinator.data.get("used_instances", 0)
-        num_instances = self.coordinator.data.get("num_instances", 0)
+        used_instances = data.get("used_instances", 0)
+        num_instances = data.get("num_instances", 0)
         
         if used_instances == 0:
-            return "All Available"
+            self._attr_native_value = "All Available"
+            self._attr_icon = "mdi:check-circle"
         elif used_instances < num_instances:
-            return f"{used_instances}/{num_instances} Used"
+            self._attr_native_value = f"{used_instances}/{num_instances} Used"
+            self._attr_icon = "mdi:alert-circle"
         else:
-            return "All Busy"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
+            self._attr_native_value = "All Busy"
+            self._attr_icon = "mdi:close-circle"
         
-        return {
-            "num_instances": self.coordinator.data.get("num_instances", 0),
-            "used_instances": self.coordinator.data.get("used_instances", 0),
-            "available_instances": self.coordinator.data.get("num_instances", 0) - self.coordinator.data.get("used_instances", 0),
-            "lines": self.coordinator.data.get("lines", []),
+        self._attr_extra_state_attributes = {
+            "num_instances": num_instances,
+            "used_instances": used_instances,
+            "available_instances": num_instances - used_instances,
+            "lines": data.get("lines", ()),
         }
-
-    @property
-    def icon(self) -> str:
-        """Return the icon to use in the frontend."""
-        if not self.coordinator.data:
-            return "mdi:help-circle"
-        
-        used_instances = self.coordinator.data.get("used_instances", 0)
-        num_instances = self.coordinator.data.get("num_instances", 0)
-        
-        if used_instances == 0:
-            return "mdi:check-circle"
-        elif used_instances < num_instances:
-            return "mdi:alert-circle"
-        else:
-            return "mdi:close-circle"
-
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        return self.coordinator.last_update_success
-
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        await self.coordinator.async_request_refresh()